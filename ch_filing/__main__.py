@@ -81,7 +81,7 @@ def main():
         elif args.submit_accounts:
 
             if args.accounts:
-                data = open(args.accounts).read()
+                data = open(args.accounts, "rb").read()
             else:
                 raise RuntimeError("--accounts must be specified")
 
@@ -110,7 +110,7 @@ def main():
         elif args.accounts_image:
 
             if args.accounts:
-                data = open(args.accounts).read()
+                data = open(args.accounts, "rb").read()
             else:
                 raise RuntimeError("--accounts must be specified")
 
@@ -1,6 +1,13 @@
 
 from lxml import objectify, etree
 import requests
+import urllib3
+
+# Shared parser for gateway responses, built once rather than per call.
+# huge_tree lifts libxml2's 10MB text node limit, which a base64 accounts
+# image can exceed.
+parser = objectify.makeparser(remove_blank_text=True, resolve_entities=False,
+                              huge_tree=True)
 
 class AuthenticationFailure(RuntimeError):
     pass
@@ -24,6 +31,19 @@ class Client:
     def __init__(self, state):
         self.state = state
 
+        # Persistent session, so that consecutive calls to the gateway
+        # re-use the same HTTPS connection.
+        self.session = requests.Session()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def get_next_tx_id(self):
         return self.state.get_next_tx_id()
 
@@ -37,17 +57,25 @@ class Client:
         enc = etree.tostring(env, pretty_print=True, xml_declaration=True)
 
         try:
-            resp = requests.post(self.state.get("url"), data=enc,
-                                 headers=header)
+            resp = self.session.post(self.state.get("url"), data=enc,
+                                     headers=header, stream=True)
         except requests.exceptions.SSLError as e:
             raise PrivacyFailure(str(e))
         except requests.exceptions.ConnectionError as e:
             raise RequestFailure(str(e))
 
-        if resp.status_code != 200:
-            raise RuntimeError("Status " + str(resp.status_code))
+        with resp:
+
+            if resp.status_code != 200:
+                raise RuntimeError("Status " + str(resp.status_code))
 
-        root = objectify.fromstring(resp.text.encode("utf-8"))
+            # Parse straight off the socket rather than buffering the
+            # whole body first.  lxml honours the XML declaration's encoding.
+            resp.raw.decode_content = True
+            try:
+                root = objectify.parse(resp.raw, parser).getroot()
+            except urllib3.exceptions.HTTPError as e:
+                raise RequestFailure(str(e))
 
         self.review_errors(root)
 
@@ -6,19 +6,20 @@ cd_sl = "http://xmlgw.companieshouse.gov.uk/v2-1/schema/CompanyData-v3-3.xsd"
 
 xsi_ns = "http://www.w3.org/2001/XMLSchema-instance"
 
+# Element factory is stateless, so build it once.
+maker = objectify.ElementMaker(
+    annotate=False,
+    namespace=cd_ns,
+    nsmap={
+        None: cd_ns
+    }
+)
+
 class CompanyData:
 
     @staticmethod
     def create_request(st):
 
-        maker = objectify.ElementMaker(
-            annotate=False,
-            namespace=cd_ns,
-            nsmap={
-                None: cd_ns
-            }
-        )
-
         cdr = maker.CompanyDataRequest(
             maker.CompanyNumber(st.get("company-number")),
             maker.CompanyAuthenticationCode(
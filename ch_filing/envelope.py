@@ -7,19 +7,19 @@ env_sl = "http://xmlgw.companieshouse.gov.uk/v2-1/schema/Egov_ch-v2-0.xsd"
 
 xsi_ns = "http://www.w3.org/2001/XMLSchema-instance"
 
+maker = objectify.ElementMaker(
+    annotate=False,
+    namespace=env_ns,
+    nsmap={
+        None: env_ns
+    }
+)
+
 class Envelope:
 
     @staticmethod
     def create(st, content, cls, qualifier):
 
-        maker = objectify.ElementMaker(
-            annotate=False,
-            namespace=env_ns,
-            nsmap={
-                None: env_ns
-            }
-        )
-
         pres_id = st.get("presenter-id")
         pres_hash = hashlib.md5(pres_id.encode("utf-8")).hexdigest()
 
@@ -1,26 +1,34 @@
 
 from lxml import objectify
-import base64
+
+# pybase64 provides SIMD-accelerated encoding, use it when available.
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 fs_ns = "http://xmlgw.companieshouse.gov.uk/Header"
 fs_sl = "http://xmlgw.companieshouse.gov.uk/v1-1/schema/forms/FormSubmission-v2-11.xsd"
 
 xsi_ns = "http://www.w3.org/2001/XMLSchema-instance"
 
+maker = objectify.ElementMaker(
+    annotate=False,
+    namespace=fs_ns,
+    nsmap={
+        None: fs_ns
+    }
+)
+
 class Accounts:
 
     @staticmethod
     def create_submission(st, fname, data):
 
-        maker = objectify.ElementMaker(
-            annotate=False,
-            namespace=fs_ns,
-            nsmap={
-                None: fs_ns
-            }
-        )
+        if isinstance(data, str):
+            data = data.encode("utf-8")
 
-        data = base64.b64encode(data.encode("utf-8")).decode("utf-8")
+        data = b64encode(data).decode("ascii")
 
         # Truncated base64 error
 #        data = data[:10]
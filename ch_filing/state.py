@@ -7,16 +7,33 @@ class State:
         self.config_file = config_file
         self.state_file = state_file
         self.state = self.load_state()
+    @classmethod
+    def from_dict(cls, config, state_file=None):
+        # Build from an already-parsed configuration, skipping the
+        # config file read.  Without a state file, counters are kept in
+        # memory only.
+        st = cls.__new__(cls)
+        st.config = config
+        st.config_file = None
+        st.state_file = state_file
+        st.state = st.load_state()
+        return st
     def load_state(self):
         # FIXME: Check it exists!
+        if self.state_file is None:
+            return {
+                "transaction-id": 0,
+                "submission-id": 0
+            }
         try:
-            return json.loads(open("state.json").read())
+            return json.loads(open(self.state_file).read())
         except:
             return {
                 "transaction-id": 0,
                 "submission-id": 0
             }
     def write(self):
+        if self.state_file is None: return
         with open(self.state_file, "w") as f:
             f.write(json.dumps(self.state))
     def get_next_tx_id(self):
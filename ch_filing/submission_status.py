@@ -6,18 +6,18 @@ gss_sl="http://xmlgw.companieshouse.gov.uk/v2-1/schema/forms/GetSubmissionStatus
 
 xsi_ns = "http://www.w3.org/2001/XMLSchema-instance"
 
+maker = objectify.ElementMaker(
+    annotate=False,
+    namespace=gss_ns,
+    nsmap={
+        None: gss_ns
+    }
+)
+
 class SubmissionStatus:
 
     def create_request(st, sub_id=None):
 
-        maker = objectify.ElementMaker(
-            annotate=False,
-            namespace=gss_ns,
-            nsmap={
-                None: gss_ns
-            }
-        )
-
         if sub_id:
             c = maker.GetSubmissionStatus(
                 maker.SubmissionNumber(sub_id),